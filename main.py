@@ -1,4 +1,5 @@
 import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from dotenv import load_dotenv
@@ -6,6 +7,8 @@ from routes.loads import router as loads_router
 from routes.verify import router as verify_router
 from routes.negotiate import router as negotiate_router
 from routes.analytics import router as analytics_router
+from routes.bookings import router as bookings_router, load_ids
+from routes.lane_stats import lane_index
 
 load_dotenv()
 
@@ -18,7 +21,15 @@ if not API_KEY:
         "Add it with `flyctl secrets set HAPPYROBOT_REST_API_KEY=abcd1234`."
     )
 
-app = FastAPI(title="Inbound Carrier Sales API")
+# ── startup: build in-memory indexes before serving ─────────────────────────
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # request paths then only do O(1) reads of the cached index
+    lane_index()
+    load_ids()
+    yield
+
+app = FastAPI(title="Inbound Carrier Sales API", lifespan=lifespan)
 
 # ── middleware: header-based auth ─────────────────────────────────────────────
 @app.middleware("http")
@@ -41,6 +52,7 @@ app.include_router(loads_router)
 app.include_router(verify_router)
 app.include_router(negotiate_router)
 app.include_router(analytics_router)
+app.include_router(bookings_router)
 
 # ── health-check ─────────────────────────────────────────────────────────────
 @app.get("/ping")
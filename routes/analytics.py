@@ -4,10 +4,11 @@ GET pops the newest record and immediately discards it.
 Nothing is written to disk or a DB.
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, BackgroundTasks, HTTPException
 from pydantic import BaseModel, field_validator
 from datetime import datetime, timezone
 from typing import Optional, List
+from routes.lane_stats import lane_index
 
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 DATA_STORE: List[dict] = []
@@ -16,6 +17,7 @@ DATA_STORE: List[dict] = []
 class CallAnalytics(BaseModel):
     carrier_name: Optional[str]
     mc_number: Optional[str]
+    load_id: Optional[str] = None
     offer_amount: Optional[float] = None
     counter_offer_amount: Optional[float] = None
     final_rate: float
@@ -35,6 +37,18 @@ class CallAnalytics(BaseModel):
             return float(clean)
         return v
     
+    @field_validator("load_id", mode="before")
+    @classmethod
+    def sanitize_load_id(cls, v):
+        # never reject the whole record over a malformed id; bare numbers
+        # map to the board's "L1234" form
+        if isinstance(v, bool) or not isinstance(v, (str, int)):
+            return None
+        v = str(v).strip()
+        if v.isdigit():
+            return f"L{v}"
+        return v or None
+
     @field_validator("timestamp", mode="after")
     @classmethod
     def ensure_timestamp(cls, v):
@@ -42,7 +56,8 @@ class CallAnalytics(BaseModel):
     
 # Step 2: Create POST endpoint to receive data
 @router.post("", response_model=CallAnalytics)
-async def receive_call_data(data: CallAnalytics) -> CallAnalytics:
+async def receive_call_data(data: CallAnalytics,
+                            background: BackgroundTasks) -> CallAnalytics:
     # Example validation: if no outcome, reject
     if not data.call_outcome:
         raise HTTPException(status_code=400, detail="Missing call_outcome")
@@ -51,6 +66,10 @@ async def receive_call_data(data: CallAnalytics) -> CallAnalytics:
     # For now, just log it
     DATA_STORE.append(data.model_dump())
 
+    # Feed closed rates into the lane statistics after the response is sent
+    if data.load_id and data.negotiation_outcome == "accepted":
+        background.add_task(lane_index().record, data.load_id, data.final_rate)
+
     return data
 
 @router.get("/events", response_model=List[CallAnalytics])
@@ -0,0 +1,74 @@
+"""
+routes/bookings.py
+Hold → confirm / release a load once negotiation hands off.
+State lives in routes/reservations.py.
+"""
+
+from dataclasses import asdict
+from datetime import datetime
+from functools import lru_cache
+
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel
+from routes.loads import load_df
+from routes.reservations import BOOK
+
+router = APIRouter(prefix="/bookings", tags=["bookings"])
+
+
+@lru_cache
+def load_ids() -> frozenset[str]:
+    return frozenset(load_df().load_id)
+
+
+def _require_load(load_id: str) -> None:
+    # checked before any per-load lock is created for the id
+    if load_id not in load_ids():
+        raise HTTPException(404, "Load ID not found")
+
+
+# ---------- request / response models -----------------------------------------
+class HoldIn(BaseModel):
+    load_id: str
+    mc_number: str | None = None
+
+
+class ReservationIn(BaseModel):
+    load_id: str
+    hold_id: str
+
+
+class BookingOut(BaseModel):
+    load_id: str
+    hold_id: str
+    status: str                     # "held", "booked" or "released"
+    mc_number: str | None = None
+    expires_at: datetime | None = None
+
+
+# ---------- routes --------------------------------------------------------------
+@router.post("/hold", response_model=BookingOut)
+def hold_load(payload: HoldIn):
+    _require_load(payload.load_id)
+    res = BOOK.hold(payload.load_id, payload.mc_number)
+    if res is None:
+        raise HTTPException(409, "Load is already held or booked")
+    return asdict(res)
+
+
+@router.post("/confirm", response_model=BookingOut)
+def confirm_load(payload: ReservationIn):
+    _require_load(payload.load_id)
+    res = BOOK.confirm(payload.load_id, payload.hold_id)
+    if res is None:
+        raise HTTPException(409, "Hold expired or not found")
+    return asdict(res)
+
+
+@router.post("/release", response_model=BookingOut)
+def release_load(payload: ReservationIn):
+    _require_load(payload.load_id)
+    if not BOOK.release(payload.load_id, payload.hold_id):
+        raise HTTPException(409, "Hold not found")
+    return {"load_id": payload.load_id, "hold_id": payload.hold_id,
+            "status": "released"}
@@ -0,0 +1,126 @@
+"""
+routes/lane_stats.py
+Lane rate statistics used as negotiation guardrails.
+
+- Seeded once from the loads board: rate per mile (RPM) quantiles per
+  (origin, destination, equipment) lane. Lanes with too few loads borrow
+  their equipment type's relative spread (p25/p50, p75/p50) as a shape.
+- Nudged by every accepted `/analytics` outcome with decayed running
+  quantiles, so recent closes outweigh old ones.
+- A lane only yields a guardrail once it has LANE_MIN_SAMPLES observations;
+  RPM varies too much with distance to fall back to equipment-wide rates.
+- Reads are a couple of dict lookups (no lock); writers replace immutable
+  LaneStat entries one key at a time under a writer-only lock.
+"""
+
+from __future__ import annotations
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import NamedTuple
+
+from routes.loads import load_df
+
+# ---------- Tunables ----------
+LANE_DECAY        = 0.10   # step size of the running quantile updates
+LANE_MIN_SAMPLES  = 3      # below this a lane is too thin to trust
+MIN_SPREAD        = 0.05   # floor on the quantile step, as fraction of p50
+QUANTILES         = (0.25, 0.50, 0.75)
+
+
+@dataclass(frozen=True)
+class LaneStat:
+    p25: float      # rate per mile
+    p50: float
+    p75: float
+    count: int
+
+
+class LoadLane(NamedTuple):
+    lane: tuple[str, str, str]   # (origin, destination, equipment)
+    miles: float
+
+
+def _norm(value: str) -> str:
+    return str(value).replace(", ", ",").strip().lower()
+
+
+def _decayed_update(stat: LaneStat, rpm: float) -> LaneStat:
+    """One stochastic-approximation step per tracked quantile."""
+    step = LANE_DECAY * max(stat.p75 - stat.p25, MIN_SPREAD * stat.p50)
+    p25, p50, p75 = (
+        q + step * (tau - (1.0 if rpm < q else 0.0))
+        for q, tau in zip((stat.p25, stat.p50, stat.p75), QUANTILES)
+    )
+    # keep the band ordered after independent updates
+    p50 = max(p50, p25)
+    p75 = max(p75, p50)
+    return LaneStat(p25=p25, p50=p50, p75=p75, count=stat.count + 1)
+
+
+class LaneIndex:
+    def __init__(self, stats: dict, loads: dict[str, LoadLane]):
+        self.stats = stats      # lane tuple → LaneStat
+        self.loads = loads      # load_id → LoadLane
+        self._lock = threading.Lock()
+
+    def guardrail(self, load_id: str) -> float | None:
+        """Lane p75 in dollars for this load; None while the lane is thin."""
+        info = self.loads.get(load_id)
+        if info is None or info.miles <= 0:
+            return None
+        stat = self.stats.get(info.lane)
+        if stat is None or stat.count < LANE_MIN_SAMPLES:
+            return None
+        return stat.p75 * info.miles
+
+    def record(self, load_id: str, final_rate: float) -> None:
+        """Fold one closed rate into the lane statistics."""
+        info = self.loads.get(load_id)
+        if info is None or info.miles <= 0 or final_rate <= 0:
+            return
+        rpm = final_rate / info.miles
+        with self._lock:
+            stat = self.stats.get(info.lane)
+            if stat is None:
+                self.stats[info.lane] = LaneStat(rpm, rpm, rpm, 1)
+            else:
+                self.stats[info.lane] = _decayed_update(stat, rpm)
+
+
+def build_index(df) -> LaneIndex:
+    df = df[df.miles.astype(float) > 0].copy()
+    df["rpm"] = df.loadboard_rate.astype(float) / df.miles.astype(float)
+    df["o"] = df.origin.map(_norm)
+    df["d"] = df.destination.map(_norm)
+    df["e"] = df.equipment_type.map(_norm)
+
+    lanes = df.groupby(["o", "d", "e"]).rpm
+    lane_q = lanes.quantile(list(QUANTILES)).unstack()
+    sizes = lanes.size()
+    # only the relative shape is used, so distance differences cancel out
+    equip_q = df.groupby("e").rpm.quantile(list(QUANTILES)).unstack()
+
+    stats: dict = {}
+    for key, row in lane_q.iterrows():
+        p25, p50, p75 = (float(row[t]) for t in QUANTILES)
+        count = int(sizes[key])
+        # A lane seeded from one or two loads has no spread of its own, which
+        # would make the running quantiles crawl; borrow the equipment's shape.
+        equip = equip_q.loc[key[2]]
+        if count < LANE_MIN_SAMPLES and equip[0.50] > 0:
+            p25 = min(p25, p50 * equip[0.25] / equip[0.50])
+            p75 = max(p75, p50 * equip[0.75] / equip[0.50])
+        stats[key] = LaneStat(p25=p25, p50=p50, p75=p75, count=count)
+
+    loads = {
+        str(r.load_id): LoadLane((r.o, r.d, r.e), float(r.miles))
+        for r in df.itertuples(index=False)
+    }
+    return LaneIndex(stats, loads)
+
+
+@lru_cache
+def lane_index() -> LaneIndex:
+    """Built once per process from the loads board."""
+    return build_index(load_df())
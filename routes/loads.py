@@ -7,6 +7,7 @@ from datetime import datetime
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
+from routes.reservations import BOOK
 load_dotenv()
 
 
@@ -75,7 +76,9 @@ def search_loads(
         & df.destination.str.contains(destination, case=False, na=False)
         & df.equipment_type.str.contains(equipment_type, case=False, na=False)
     )
-    matches = df[mask].head(limit)
+    matches = df[mask]
+    # Held / booked loads drop out here; O(1) lock-free check per candidate
+    matches = matches[~matches.load_id.map(BOOK.is_taken)].head(limit)
 
     if matches.empty:
         return {"loads": []}
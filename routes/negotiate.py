@@ -6,6 +6,8 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, field_validator
 from dotenv import load_dotenv
 from routes.negotiate_graph import run_negotiation
+from routes.lane_stats import lane_index
+from routes.reservations import BOOK
 
 load_dotenv()
 router = APIRouter(prefix="/evaluate-offer", tags=["negotiation"])
@@ -25,6 +27,7 @@ class OfferIn(BaseModel):
     load_id: str
     offer: float 
     attempts: int 
+    mc_number: str | None = None
 
     @field_validator("offer", mode="before")
     @classmethod
@@ -42,6 +45,7 @@ class OfferOut(BaseModel):
     attempts: int          # echo back so the agent can track rounds
     handoff: bool        # True => transfer to human rep now
     final: bool          # True => terminal (accept/reject or max attempts)
+    hold_id: str | None = None   # set on accept; confirm/release via /bookings
 
 # ───────────────────────── route ------------------------------------------------
 @router.post("", response_model=OfferOut)
@@ -49,17 +53,28 @@ def evaluate_offer(payload: OfferIn):
     rates = rate_lookup()
     if payload.load_id not in rates:
         raise HTTPException(404, "Load ID not found")
+    if BOOK.is_taken(payload.load_id):
+        raise HTTPException(409, "Load is already held or booked")
 
     board_rate = float(rates[payload.load_id])
 
     result = run_negotiation(
         board_rate=board_rate,
         initial_offer=payload.offer,
-        attempts=payload.attempts
+        attempts=payload.attempts,
+        lane_p75=lane_index().guardrail(payload.load_id),
     )
     # ensure required keys present
     result.setdefault("handoff", result.get("status") == "accept")
     result.setdefault("final",   result.get("status") in ("accept", "reject"))
+
+    # Take the load off the board before handing off, so no other caller
+    # can be told "accept" for it in the meantime
+    if result["status"] == "accept":
+        hold = BOOK.hold(payload.load_id, payload.mc_number)
+        if hold is None:
+            raise HTTPException(409, "Load is already held or booked")
+        result["hold_id"] = hold.hold_id
     
     updated = result.get("attempts", payload.attempts)
     # result["attempts"] = updated
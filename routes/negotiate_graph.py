@@ -4,6 +4,8 @@ Negotiation rules:
 - Accept if |offer - board| <= ACCEPT_WITHIN * board  → handoff to human
 - Counter if within NEGOTIATE_WITHIN * board         → up to MAX_ATTEMPTS
 - Reject otherwise or if attempts hit MAX_ATTEMPTS
+- Optional lane p75 (in $) from routes/lane_stats.py caps accepts and
+  counters at max(board, lane p75)
 """
 
 from __future__ import annotations
@@ -45,6 +47,7 @@ class NegotiationState(TypedDict, total=False):
     offer: float
     last_driver_offer: float   # new field to remember it
     attempts: int
+    lane_p75: float | None   # what the lane typically closes at, in $
     result: dict   # {"status": str, "target_rate": float, "message": str, "handoff": bool, "final": bool}
 
 def llm_round(board: float, offer: float) -> dict | None:
@@ -67,12 +70,16 @@ def llm_round(board: float, offer: float) -> dict | None:
     except Exception:
         return None
 
-def deterministic_round(board: float, offer: float, attempts: int) -> dict:
+def deterministic_round(board: float, offer: float, attempts: int,
+                        lane_p75: float | None = None) -> dict:
     gap = offer - board
     abs_pct = abs(gap) / board if board > 0 else 1.0
 
+    # Lane guardrail: never pay above what the lane usually closes at
+    lane_ceiling = max(board, lane_p75) if lane_p75 else None
+
     # Accept in tight band
-    if abs_pct <= ACCEPT_WITHIN:
+    if abs_pct <= ACCEPT_WITHIN and (lane_ceiling is None or offer <= lane_ceiling):
         return {
             "status": "accept",
             "target_rate": float(round(offer)),
@@ -86,6 +93,8 @@ def deterministic_round(board: float, offer: float, attempts: int) -> dict:
     HIGH_CAPS = [0.25, 0.18, 0.12]  # attempt 1/2/3 → +25%, +18%, +12% over board
     high_cap = HIGH_CAPS[min(max(attempts, 1) - 1, len(HIGH_CAPS) - 1)]
     high_ceiling = board * (1 + high_cap)
+    if lane_ceiling is not None:
+        high_ceiling = min(high_ceiling, lane_ceiling)
 
     if gap >= 0:
         # Driver ABOVE board: always counter, but clamp near board
@@ -134,7 +143,7 @@ def evaluate(state: NegotiationState) -> NegotiationState:
     tries = state.get("attempts", 1)
 
     # Run the negotiation logic
-    result = deterministic_round(board, offer, tries)
+    result = deterministic_round(board, offer, tries, state.get("lane_p75"))
 
     # Ensure you return the updated attempts count
     updated_attempts = tries + 1 if result["status"] == "counter" else tries
@@ -150,11 +159,13 @@ flow.add_edge(START, "Evaluate")
 flow.add_edge("Evaluate", END)
 NEGOTIATION_GRAPH = flow.compile()
 
-def run_negotiation(board_rate: float, initial_offer: float, attempts: int = 1) -> dict:
+def run_negotiation(board_rate: float, initial_offer: float, attempts: int = 1,
+                    lane_p75: float | None = None) -> dict:
     init: NegotiationState = {
         "board_rate": float(board_rate),
         "offer": float(initial_offer),
         "attempts": int(attempts),
+        "lane_p75": lane_p75,
     }
     final_state = NEGOTIATION_GRAPH.invoke(init)
     res = final_state["result"]
@@ -0,0 +1,94 @@
+"""
+routes/reservations.py
+In-memory hold / booking state shared by search, negotiation and /bookings.
+
+- Each load has its own lock; only writers (hold/confirm/release) take it.
+- Reservations are immutable and swapped per key, so `is_taken` (used by
+  search and negotiation) is a lock-free O(1) dict lookup.
+- Holds expire after HOLD_SECONDS and the load quietly becomes available.
+"""
+
+from __future__ import annotations
+import os, threading, uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from dotenv import load_dotenv
+
+load_dotenv()
+
+HOLD_SECONDS = float(os.getenv("BOOKING_HOLD_SECONDS", "300"))
+
+
+# ---------- reservation book ---------------------------------------------------
+@dataclass(frozen=True)
+class Reservation:
+    load_id: str
+    hold_id: str
+    mc_number: str | None
+    status: str                     # "held" or "booked"
+    expires_at: datetime | None     # None once booked
+
+    def active(self, now: datetime) -> bool:
+        return self.status == "booked" or (self.expires_at is not None
+                                           and self.expires_at > now)
+
+
+class ReservationBook:
+    def __init__(self, hold_seconds: float = HOLD_SECONDS):
+        self.hold_seconds = hold_seconds
+        self._reservations: dict[str, Reservation] = {}
+        self._locks: dict[str, threading.Lock] = {}
+
+    def _lock(self, load_id: str) -> threading.Lock:
+        # setdefault is atomic, so racing callers end up with the same lock
+        return self._locks.setdefault(load_id, threading.Lock())
+
+    def is_taken(self, load_id: str) -> bool:
+        res = self._reservations.get(load_id)
+        return res is not None and res.active(datetime.now(timezone.utc))
+
+    def hold(self, load_id: str, mc_number: str | None = None) -> Reservation | None:
+        """Place a hold; None if someone else already holds or booked it."""
+        with self._lock(load_id):
+            now = datetime.now(timezone.utc)
+            current = self._reservations.get(load_id)
+            if current is not None and current.active(now):
+                return None
+            res = Reservation(
+                load_id=load_id,
+                hold_id=uuid.uuid4().hex,
+                mc_number=mc_number,
+                status="held",
+                expires_at=now + timedelta(seconds=self.hold_seconds),
+            )
+            self._reservations[load_id] = res
+            return res
+
+    def confirm(self, load_id: str, hold_id: str) -> Reservation | None:
+        """Turn a live hold into a booking; None if the hold is gone."""
+        with self._lock(load_id):
+            current = self._reservations.get(load_id)
+            if (current is None or current.hold_id != hold_id
+                    or current.status != "held"
+                    or not current.active(datetime.now(timezone.utc))):
+                return None
+            res = Reservation(load_id, hold_id, current.mc_number, "booked", None)
+            self._reservations[load_id] = res
+            return res
+
+    def release(self, load_id: str, hold_id: str) -> bool:
+        """Drop a hold or booking; False if hold_id does not own the load."""
+        with self._lock(load_id):
+            current = self._reservations.get(load_id)
+            if current is None or current.hold_id != hold_id:
+                return False
+            del self._reservations[load_id]
+            return True
+
+    def clear(self) -> None:
+        """Forget every hold, booking and lock (process restart / tests)."""
+        self._reservations = {}
+        self._locks = {}
+
+
+BOOK = ReservationBook()
@@ -0,0 +1,6 @@
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+os.environ.setdefault("LOADS_CSV_PATH", os.path.join(ROOT, "data", "loads.csv"))
+os.environ.setdefault("HAPPYROBOT_REST_API_KEY", "test-key")
@@ -0,0 +1,165 @@
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import API_HEADER, API_KEY, app
+from routes.bookings import load_ids
+from routes.reservations import BOOK, ReservationBook
+
+HEADERS = {API_HEADER: API_KEY}
+WORKERS = 32
+
+
+@pytest.fixture
+def client():
+    BOOK.clear()
+    with TestClient(app) as c:
+        yield c
+    BOOK.clear()
+
+
+def _race(fn, n):
+    """Release n calls of fn at the same moment and collect the results."""
+    barrier = threading.Barrier(n)
+
+    def run(i):
+        barrier.wait()
+        return fn(i)
+
+    with ThreadPoolExecutor(n) as ex:
+        return list(ex.map(run, range(n)))
+
+
+# ---------- ReservationBook ----------------------------------------------------
+def test_concurrent_holds_have_one_winner():
+    book = ReservationBook()
+    for n in range(20):
+        load_id = f"L{n}"
+        results = _race(lambda i: book.hold(load_id, str(i)), WORKERS)
+        assert sum(r is not None for r in results) == 1
+        assert book.is_taken(load_id)
+
+
+def test_concurrent_confirms_book_once():
+    book = ReservationBook()
+    hold = book.hold("L1")
+    results = _race(lambda i: book.confirm("L1", hold.hold_id), WORKERS)
+    assert sum(r is not None for r in results) == 1
+    assert book.hold("L1") is None
+
+
+def test_expired_hold_frees_the_load():
+    book = ReservationBook(hold_seconds=0)
+    hold = book.hold("L1")
+    assert not book.is_taken("L1")
+    assert book.confirm("L1", hold.hold_id) is None
+    assert book.hold("L1") is not None
+
+
+def test_release_needs_the_owning_hold():
+    book = ReservationBook()
+    hold = book.hold("L1")
+    assert not book.release("L1", "someone-else")
+    assert book.release("L1", hold.hold_id)
+    assert not book.is_taken("L1")
+
+
+# ---------- routes ---------------------------------------------------------------
+def test_unknown_load_is_404_without_creating_a_lock(client):
+    for path in ("/bookings/confirm", "/bookings/release"):
+        r = client.post(path, json={"load_id": "NOPE", "hold_id": "x"},
+                        headers=HEADERS)
+        assert r.status_code == 404
+    assert "NOPE" not in BOOK._locks
+
+
+def test_held_load_leaves_search(client):
+    q = {"origin": "San Diego", "destination": "Minneapolis",
+         "equipment_type": "PowerOnly"}
+    assert client.get("/search-loads", params=q, headers=HEADERS).json()["loads"]
+
+    hold = client.post("/bookings/hold", json={"load_id": "L9747"},
+                       headers=HEADERS).json()
+    assert client.get("/search-loads", params=q, headers=HEADERS).json()["loads"] == []
+
+    client.post("/bookings/release",
+                json={"load_id": "L9747", "hold_id": hold["hold_id"]},
+                headers=HEADERS)
+    assert client.get("/search-loads", params=q, headers=HEADERS).json()["loads"]
+
+
+def test_accepted_offer_holds_the_load(client):
+    offer = {"load_id": "L9747", "offer": 3313, "attempts": 1}
+    results = _race(lambda i: client.post("/evaluate-offer", json=offer,
+                                          headers=HEADERS), WORKERS)
+    accepted = [r.json() for r in results if r.status_code == 200]
+    assert len(accepted) == 1
+    assert accepted[0]["status"] == "accept" and accepted[0]["hold_id"]
+    assert {r.status_code for r in results} == {200, 409}
+
+
+def test_search_latency_stable_under_booking_contention(client):
+    params = {"origin": "a", "destination": "a", "equipment_type": "e"}
+    ids = sorted(load_ids())
+    owners: dict[str, int] = {}
+    owners_lock = threading.Lock()
+    double_holds = []
+
+    def search_p50(writer, n_writers=8, n_searches=100):
+        """Search repeatedly while writer threads loop until we are done."""
+        stop = threading.Event()
+        done = [0] * n_writers
+
+        def loop(w):
+            k = 0
+            while not stop.is_set():
+                writer(w, ids[(k + w) % len(ids)])
+                done[w] += 1
+                k += 1
+
+        threads = [threading.Thread(target=loop, args=(w,)) for w in range(n_writers)]
+        for t in threads:
+            t.start()
+        samples = []
+        for _ in range(n_searches):
+            t0 = time.perf_counter()
+            client.get("/search-loads", params=params, headers=HEADERS)
+            samples.append(time.perf_counter() - t0)
+        writes = sum(done)          # only writes overlapping the searches
+        stop.set()
+        for t in threads:
+            t.join()
+        return statistics.median(samples), writes
+
+    def ping(w, load_id):
+        client.get("/ping")
+
+    def hold_release(w, load_id):
+        # every write takes the per-load lock and changes the reservations
+        r = client.post("/bookings/hold", json={"load_id": load_id},
+                        headers=HEADERS)
+        if r.status_code != 200:
+            return
+        with owners_lock:
+            if load_id in owners:
+                double_holds.append(load_id)
+            owners[load_id] = w
+        with owners_lock:
+            del owners[load_id]     # before the load can be re-held
+        client.post("/bookings/release",
+                    json={"load_id": load_id, "hold_id": r.json()["hold_id"]},
+                    headers=HEADERS)
+
+    # same request volume with and without reservation writes, so the
+    # comparison isolates lock contention from client / GIL saturation
+    control, _ = search_p50(ping)
+    contended, writes = search_p50(hold_release)
+
+    assert writes >= 100
+    assert not double_holds
+    assert contended < 3 * control
+    assert not any(BOOK.is_taken(i) for i in ids)
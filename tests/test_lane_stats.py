@@ -0,0 +1,63 @@
+from fastapi.testclient import TestClient
+
+from main import API_HEADER, API_KEY, app
+from routes.analytics import CallAnalytics
+from routes.lane_stats import LANE_MIN_SAMPLES, build_index, lane_index
+from routes.loads import load_df
+from routes.negotiate_graph import deterministic_round
+
+
+def test_single_load_lane_is_seeded_with_a_spread():
+    ix = build_index(load_df())
+    stat = ix.stats[ix.loads["L9013"].lane]
+    assert stat.p25 < stat.p50 < stat.p75
+
+
+def test_no_guardrail_until_lane_has_its_own_samples():
+    ix = build_index(load_df())
+    assert all(ix.guardrail(load_id) is None for load_id in ix.loads)
+
+
+def test_band_moves_toward_repeated_closes():
+    ix = build_index(load_df())
+    info = ix.loads["L9013"]                       # board $1813
+    before = ix.stats[info.lane].p75 * info.miles
+
+    for _ in range(5):
+        ix.record("L9013", 5000)
+
+    assert ix.stats[info.lane].count >= LANE_MIN_SAMPLES
+    after = ix.guardrail("L9013")
+    assert after > before + 400
+
+    # the learned ceiling must not block an offer the plain rules accept
+    assert deterministic_round(1813, 1900, 1)["status"] == "accept"
+    assert deterministic_round(1813, 1900, 1, after)["status"] == "accept"
+
+
+def test_lane_ceiling_caps_counters():
+    res = deterministic_round(2000, 2400, 1, lane_p75=2100)
+    assert res["status"] == "counter"
+    assert res["target_rate"] <= 2100
+
+
+def test_analytics_load_id_never_rejects_record():
+    base = {"carrier_name": "x", "mc_number": "1", "final_rate": "$1,900",
+            "negotiation_outcome": "accepted", "call_outcome": "booked",
+            "sentiment": "positive"}
+    assert CallAnalytics(**base, load_id=9013).load_id == "L9013"
+    assert CallAnalytics(**base, load_id=" L9013 ").load_id == "L9013"
+    assert CallAnalytics(**base, load_id={"bad": 1}).load_id is None
+
+
+def test_numeric_load_id_reaches_the_lane_index():
+    event = {"carrier_name": "x", "mc_number": "1", "load_id": 9013,
+             "final_rate": "$1,900", "negotiation_outcome": "accepted",
+             "call_outcome": "booked", "sentiment": "positive"}
+    with TestClient(app) as client:
+        ix = lane_index()
+        lane = ix.loads["L9013"].lane
+        before = ix.stats[lane].count
+        r = client.post("/analytics", json=event, headers={API_HEADER: API_KEY})
+    assert r.status_code == 200
+    assert ix.stats[lane].count == before + 1